@@ -99,7 +99,7 @@ class ExecutionConfig:
 
         if any(arg not in SUPPORTED_GRADIENT_KWARGS for arg in self.gradient_keyword_arguments):
             raise ValueError(
-                f"All gradient_keyword_arguments keys must be in {SUPPORTED_GRADIENT_KWARGS}, got unexpected values: {set(self.gradient_keyword_arguments) - set(SUPPORTED_GRADIENT_KWARGS)}"
+                f"All gradient_keyword_arguments keys must be in {sorted(SUPPORTED_GRADIENT_KWARGS)}, got unexpected values: {set(self.gradient_keyword_arguments) - SUPPORTED_GRADIENT_KWARGS}"
             )
 
 
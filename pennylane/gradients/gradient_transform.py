@@ -14,7 +14,7 @@
 """This module contains utilities for defining custom gradient transforms,
 including a decorator for specifying gradient expansions."""
 # pylint: disable=too-few-public-methods
-from functools import partial
+from functools import lru_cache, partial
 import warnings
 import numpy as np
 
@@ -29,33 +29,35 @@ from pennylane.measurements import (
     Shots,
 )
 
-SUPPORTED_GRADIENT_KWARGS = [
-    "approx_order",
-    "argnum",
-    "aux_wire",
-    "broadcast",  # [TODO: This is in param_shift. Unify with use_broadcasting in stoch_pulse_grad
-    "device_wires",
-    "diagonal_shifts",
-    "f0",
-    "force_order2",
-    "gradient_recipes",
-    "gradient_kwargs",
-    "h",
-    "n",
-    "num",
-    "num_directions",
-    "num_split_times",
-    "off_diagonal_shifts",
-    "order",
-    "reduction",
-    "sampler",
-    "sampler_seed",
-    "shifts",
-    "shots",
-    "strategy",
-    "use_broadcasting",
-    "validate_params",
-]
+SUPPORTED_GRADIENT_KWARGS = frozenset(
+    {
+        "approx_order",
+        "argnum",
+        "aux_wire",
+        "broadcast",  # [TODO: This is in param_shift. Unify with use_broadcasting in stoch_pulse_grad
+        "device_wires",
+        "diagonal_shifts",
+        "f0",
+        "force_order2",
+        "gradient_recipes",
+        "gradient_kwargs",
+        "h",
+        "n",
+        "num",
+        "num_directions",
+        "num_split_times",
+        "off_diagonal_shifts",
+        "order",
+        "reduction",
+        "sampler",
+        "sampler_seed",
+        "shifts",
+        "shots",
+        "strategy",
+        "use_broadcasting",
+        "validate_params",
+    }
+)
 
 
 def assert_active_return(transform_name):
@@ -114,6 +116,40 @@ def assert_no_variance(measurements, transform_name):
         )
 
 
+@lru_cache(maxsize=1024)
+def _ops_influencing_observables(op_wires, obs_wires, all_wires):
+    """Determine which operations of a circuit have an influence on any of its
+    observables, i.e., lie on a path to an observable in the circuit graph.
+
+    Instead of constructing the circuit graph and querying it for each pair of operation
+    and observable, the operations are swept once in reverse order while keeping track of
+    the wires that influence an observable. As the result only depends on the wire
+    structure of the circuit, it is cached so that structurally identical tapes (as
+    created in each step of an optimization loop) can reuse it.
+
+    Args:
+        op_wires (tuple[.Wires]): wires of the circuit operations, in order
+        obs_wires (tuple[.Wires]): wires of the circuit observables
+        all_wires (.Wires): all wires of the circuit. Operations and observables without
+            wires act on all of them.
+
+    Returns:
+        tuple[bool]: whether each of the operations influences an observable
+    """
+    live_wires = set()
+    for wires in obs_wires:
+        live_wires.update(wires or all_wires)
+
+    influence = [False] * len(op_wires)
+    for idx in range(len(op_wires) - 1, -1, -1):
+        wires = op_wires[idx] or all_wires
+        if not live_wires.isdisjoint(wires):
+            influence[idx] = True
+            live_wires.update(wires)
+
+    return tuple(influence)
+
+
 def _gradient_analysis(tape, use_graph=True, grad_fn=None):
     """Update the parameter information dictionary of the tape with
     gradient information of each parameter.
@@ -126,41 +162,69 @@ def _gradient_analysis(tape, use_graph=True, grad_fn=None):
 
         tape._gradient_fn = grad_fn
 
+    operations = tape.operations
+    trainable_params = set(tape.trainable_params)
+    has_grad_method = qml.operation.has_grad_method
+    # parameter information of trainable operations with a registered gradient method
+    differentiable = []
+
     for idx, info in enumerate(tape._par_info):
-        if idx not in tape.trainable_params:
+        if idx not in trainable_params:
             # non-trainable parameters do not require a grad_method
             info["grad_method"] = None
-        else:
-            op = tape._par_info[idx]["op"]
-
-            if not qml.operation.has_grad_method(op):
-                # no differentiation method is registered for this operation
-                info["grad_method"] = None
+            continue
 
-            elif (tape._graph is not None) or use_graph:
-                if not any(tape.graph.has_path(op, ob) for ob in tape.observables):
-                    # there is no influence of this operation on any of the observables
-                    info["grad_method"] = "0"
-                    continue
-
-            info["grad_method"] = op.grad_method
+        op = info["op"]
+        if not has_grad_method(op):
+            # no differentiation method is registered for this operation
+            info["grad_method"] = None
+            continue
+
+        info["grad_method"] = op.grad_method
+        differentiable.append(info)
+
+    if differentiable and ((tape._graph is not None) or use_graph):
+        # observable parameters always influence the observable itself
+        check_influence = [
+            info
+            for info in differentiable
+            if info["op_idx"] < len(operations) and operations[info["op_idx"]] is info["op"]
+        ]
+        influence = _ops_influencing_observables(
+            tuple(op.wires for op in operations),
+            tuple(ob.wires for ob in tape.observables),
+            tape.wires,
+        )
+        for info in check_influence:
+            if not influence[info["op_idx"]]:
+                # there is no influence of this operation on any of the observables
+                info["grad_method"] = "0"
 
 
 def _grad_method_validation(method, tape):
     """Validates if the gradient method requested is supported by the trainable
     parameters of a tape, and returns the allowed parameter gradient methods."""
-    diff_methods = {
-        idx: info["grad_method"]
-        for idx, info in enumerate(tape._par_info)  # pylint: disable=protected-access
-        if idx in tape.trainable_params
-    }
+    trainable_params = set(tape.trainable_params)
+    diff_methods = []
+    nondiff_params = set()
+    numeric_params = set()
+
+    for idx, info in enumerate(tape._par_info):  # pylint: disable=protected-access
+        if idx not in trainable_params:
+            continue
+
+        g = info["grad_method"]
+        diff_methods.append(g)
+
+        if g is None:
+            nondiff_params.add(idx)
+        elif g == "F":
+            numeric_params.add(idx)
 
     # check and raise an error if any parameters are non-differentiable
-    if nondiff_params := {idx for idx, g in diff_methods.items() if g is None}:
+    if nondiff_params:
         raise ValueError(f"Cannot differentiate with respect to parameter(s) {nondiff_params}")
 
-    numeric_params = {idx for idx, g in diff_methods.items() if g == "F"}
-
     # If explicitly using analytic mode, ensure that all parameters
     # support analytic differentiation.
     if method == "analytic" and numeric_params:
@@ -168,7 +232,7 @@ def _grad_method_validation(method, tape):
             f"The analytic gradient method cannot be used with the parameter(s) {numeric_params}."
         )
 
-    return tuple(diff_methods.values())
+    return tuple(diff_methods)
 
 
 def gradient_analysis_and_validation(tape, method, use_graph=True, grad_fn=None, overwrite=True):
@@ -237,11 +301,9 @@ def choose_grad_methods(diff_methods, argnum):
         return dict(enumerate(diff_methods))
 
     if isinstance(argnum, int):
-        argnum = [argnum]
+        return {argnum: diff_methods[argnum]}
 
-    num_params = len(argnum)
-
-    if num_params == 0:
+    if len(argnum) == 0:
         warnings.warn(
             "No trainable parameters were specified for computing the Jacobian.",
             UserWarning,
@@ -251,30 +313,34 @@ def choose_grad_methods(diff_methods, argnum):
     return {idx: diff_methods[idx] for idx in argnum}
 
 
+def _nest_zero_grads(zeros, shots):
+    """Arrange the zero gradients of each measurement into the output structure of
+    a gradient transform, taking into account the number of measurements and shot vectors."""
+    grads = zeros[0] if len(zeros) == 1 else tuple(zeros)
+    if shots.has_partitioned_shots:
+        return tuple(grads for _ in range(shots.num_copies))
+    return grads
+
+
 def _all_zero_grad(tape, shots=Shots(None)):
     """Auxiliary function to return zeros for the all-zero gradient case."""
-    list_zeros = []
-
     par_shapes = [qml.math.shape(p) for p in tape.get_parameters()]
-    for m in tape.measurements:
-        # TODO: Update shape for CV variables
-        shape = (2 ** len(m.wires),) if isinstance(m, ProbabilityMP) else ()
-        if len(tape.trainable_params) == 1:
-            sub_list_zeros = qml.math.zeros(par_shapes[0] + shape)
+    # TODO: Update shape for CV variables
+    meas_shapes = [
+        (2 ** len(m.wires),) if isinstance(m, ProbabilityMP) else () for m in tape.measurements
+    ]
+    single_param = len(tape.trainable_params) == 1
+
+    def processing_fn(_):
+        # the zero arrays are only allocated once the gradient is requested; they are
+        # always plain NumPy arrays, so NumPy is called directly rather than via dispatch
+        if single_param:
+            zeros = [np.zeros(par_shapes[0] + shape) for shape in meas_shapes]
         else:
-            sub_list_zeros = tuple(qml.math.zeros(sh + shape) for sh in par_shapes)
-
-        list_zeros.append(sub_list_zeros)
+            zeros = [tuple(np.zeros(sh + shape) for sh in par_shapes) for shape in meas_shapes]
+        return _nest_zero_grads(zeros, shots)
 
-    if shots.has_partitioned_shots:
-        if len(tape.measurements) == 1:
-            return [], lambda _: tuple(list_zeros[0] for _ in range(shots.num_copies))
-        return [], lambda _: tuple(tuple(list_zeros) for _ in range(shots.num_copies))
-
-    if len(tape.measurements) == 1:
-        return [], lambda _: list_zeros[0]
-
-    return [], lambda _: tuple(list_zeros)
+    return [], processing_fn
 
 
 _no_trainable_grad_warning = (
@@ -288,17 +354,8 @@ def _no_trainable_grad(tape, shots=Shots(None)):
     """Auxiliary function that returns correctly formatted gradients when there
     are no trainable parameters."""
     warnings.warn(_no_trainable_grad_warning)
-    if shots.has_partitioned_shots:
-        if len(tape.measurements) == 1:
-            return [], lambda _: tuple(qml.math.zeros([0]) for _ in range(shots.num_copies))
-        return [], lambda _: tuple(
-            tuple(qml.math.zeros([0]) for _ in range(len(tape.measurements)))
-            for _ in range(shots.num_copies)
-        )
-
-    if len(tape.measurements) == 1:
-        return [], lambda _: qml.math.zeros([0])
-    return [], lambda _: tuple(qml.math.zeros([0]) for _ in range(len(tape.measurements)))
+    num_measurements = len(tape.measurements)
+    return [], lambda _: _nest_zero_grads([np.zeros([0]) for _ in range(num_measurements)], shots)
 
 
 def _no_trainable_grad_legacy(tape):
@@ -313,20 +370,17 @@ def _swap_first_two_axes(grads, first_axis_size, second_axis_size):
     a tuple of tuples."""
     if first_axis_size == 1:
         return tuple(grads[0][i] for i in range(second_axis_size))
-    return tuple(
-        tuple(grads[j][i] for j in range(first_axis_size)) for i in range(second_axis_size)
-    )
+    # ``zip`` transposes the nested structure at C level, without copying the entries
+    return tuple(zip(*(grads[j][:second_axis_size] for j in range(first_axis_size))))
 
 
 def _move_first_axis_to_third_pos(grads, first_axis_size, second_axis_size, third_axis_size):
     """Transpose the first two axes of an iterable of iterables, returning
     a tuple of tuples."""
     if first_axis_size == 1:
-        return tuple(
-            tuple(grads[0][i][j] for j in range(third_axis_size)) for i in range(second_axis_size)
-        )
+        return tuple(tuple(grads[0][i][:third_axis_size]) for i in range(second_axis_size))
     return tuple(
-        tuple(tuple(grads[k][i][j] for k in range(first_axis_size)) for j in range(third_axis_size))
+        tuple(zip(*(grads[k][i][:third_axis_size] for k in range(first_axis_size))))
         for i in range(second_axis_size)
     )
 
@@ -398,6 +452,18 @@ def reorder_grads(grads, tape_specs):
     return _move_first_axis_to_third_pos(grads, num_params, shots.num_copies, num_measurements)
 
 
+def _is_identity(cjac):
+    """Check whether a classical Jacobian is the identity matrix.
+
+    The comparison is only performed for square matrices, and uses a plain NumPy
+    identity rather than a differentiable ``qml.numpy`` tensor, since the reference
+    matrix never needs to be tracked.
+    """
+    if cjac.ndim != 2 or cjac.shape[0] != cjac.shape[1]:
+        return False
+    return qml.math.allclose(cjac, np.eye(cjac.shape[0]))
+
+
 # pylint: disable=too-many-return-statements,too-many-branches
 def _contract_qjac_with_cjac(qjac, cjac, num_measurements, has_partitioned_shots):
     """Contract a quantum Jacobian with a classical preprocessing Jacobian.
@@ -410,14 +476,9 @@ def _contract_qjac_with_cjac(qjac, cjac, num_measurements, has_partitioned_shots
         cjac = cjac[0]
 
     cjac_is_tuple = isinstance(cjac, tuple)
-    if not cjac_is_tuple:
-        is_square = cjac.ndim == 2 and cjac.shape[0] == cjac.shape[1]
-
-        if not qml.math.is_abstract(cjac) and (
-            is_square and qml.math.allclose(cjac, qml.numpy.eye(cjac.shape[0]))
-        ):
-            # Classical Jacobian is the identity. No classical processing is present in the QNode
-            return qjac
+    if not cjac_is_tuple and not qml.math.is_abstract(cjac) and _is_identity(cjac):
+        # Classical Jacobian is the identity. No classical processing is present in the QNode
+        return qjac
 
     multi_meas = num_measurements > 1
 
@@ -436,7 +497,9 @@ def _contract_qjac_with_cjac(qjac, cjac, num_measurements, has_partitioned_shots
     if not multi_params:
         # Without dimension (e.g. expval) or with dimension (e.g. probs)
         def _reshape(x):
-            return qml.math.reshape(x, (1,) if x.shape == () else (1, -1))
+            # Indexing prepends the parameter axis to scalars and vectors without
+            # a dispatched reshape; higher-dimensional entries are flattened
+            return x[None] if x.ndim < 2 else qml.math.reshape(x, (1, -1))
 
         if not (multi_meas or has_partitioned_shots):
             # Single parameter, single measurements
@@ -456,9 +519,12 @@ def _contract_qjac_with_cjac(qjac, cjac, num_measurements, has_partitioned_shots
         return tuple(tdot(qjac, c) for c in cjac if c is not None)
 
     # Multiple parameters, multiple measurements
+    qjac = tuple(qml.math.stack(q) for q in qjac)
     if not cjac_is_tuple:
-        return tuple(tdot(qml.math.stack(q), qml.math.stack(cjac)) for q in qjac)
-    return tuple(tuple(tdot(qml.math.stack(q), c) for c in cjac if c is not None) for q in qjac)
+        cjac = qml.math.stack(cjac)
+        return tuple(tdot(q, cjac) for q in qjac)
+    cjac = tuple(c for c in cjac if c is not None)
+    return tuple(tuple(tdot(q, c) for c in cjac) for q in qjac)
 
 
 def _contract_qjac_with_cjac_legacy(qjac, cjac):
@@ -473,9 +539,7 @@ def _contract_qjac_with_cjac_legacy(qjac, cjac):
         jacs = tuple(tdot(qjac, c) for c in cjac if c is not None)
         return jacs[0] if len(jacs) == 1 else jacs
 
-    is_square = cjac.ndim == 2 and cjac.shape[0] == cjac.shape[1]
-
-    if is_square and qml.math.allclose(cjac, qml.numpy.eye(cjac.shape[0])):
+    if _is_identity(cjac):
         # Classical Jacobian is the identity. No classical processing
         # is present inside the QNode.
         return qjac
@@ -586,7 +650,10 @@ class gradient_transform(qml.batch_transform):
             argnums = tkwargs.get("argnums", None)
 
             interface = qml.math.get_interface(*args)
-            trainable_params = qml.math.get_trainable_indices(args)
+            # Autograd and NumPy arguments all dispatch the same way, so the interface
+            # determined above can be reused instead of being recomputed for every argument.
+            like = interface if interface in {"autograd", "numpy", "scipy"} else None
+            trainable_params = qml.math.get_trainable_indices(args, like=like)
 
             if interface == "jax" and tkwargs.get("argnum", None):
                 raise qml.QuantumFunctionError(
@@ -18,6 +18,8 @@ import functools
 import warnings
 from typing import Sequence, Tuple, Optional
 
+import numpy as np
+
 import pennylane as qml
 from pennylane.operation import Operator
 from pennylane.wires import Wires
@@ -25,6 +27,26 @@ from pennylane.wires import Wires
 from .measurements import MeasurementShapeError, Sample, SampleMeasurement
 
 
+@functools.lru_cache()
+def _powers_of_two(num_wires):
+    """Powers of two mapping computational basis samples on ``num_wires`` wires
+    (most significant wire first) to the integer index of the sampled basis state.
+
+    The returned array is shared between calls and therefore read-only.
+    """
+    powers = 2 ** np.arange(num_wires)[::-1]
+    powers.setflags(write=False)
+    return powers
+
+
+@functools.lru_cache()
+def _wire_positions(wires, wire_order):
+    """Positions of the wire labels ``wires`` within the wire labels ``wire_order``,
+    both passed as tuples so that the mapping can be reused between calls."""
+    wire_map = dict(zip(wire_order, range(len(wire_order))))
+    return tuple(wire_map[w] for w in wires)
+
+
 def sample(op: Optional[Operator] = None, wires=None) -> "SampleMP":
     r"""Sample from the supplied observable, with the number of shots
     determined from the ``dev.shots`` attribute of the corresponding device,
@@ -137,7 +159,6 @@ class SampleMP(SampleMeasurement):
         return Sample
 
     @property
-    @functools.lru_cache()
     def numeric_type(self):
         # Note: we only assume an integer numeric type if the observable is a
         # built-in observable with integer eigenvalues or a tensor product thereof
@@ -145,7 +166,7 @@ class SampleMP(SampleMeasurement):
             # Computational basis samples
             return int
         int_eigval_obs = {qml.PauliX, qml.PauliY, qml.PauliZ, qml.Hadamard, qml.Identity}
-        tensor_terms = self.obs.obs if hasattr(self.obs, "obs") else [self.obs]
+        tensor_terms = self.obs.obs if hasattr(self.obs, "obs") else (self.obs,)
         every_term_standard = all(o.__class__ in int_eigval_obs for o in tensor_terms)
         return int if every_term_standard else float
 
@@ -206,8 +227,7 @@ class SampleMP(SampleMeasurement):
         shot_range: Tuple[int] = None,
         bin_size: int = None,
     ):
-        wire_map = dict(zip(wire_order, range(len(wire_order))))
-        mapped_wires = [wire_map[w] for w in self.wires]
+        mapped_wires = _wire_positions(self.wires.labels, Wires(wire_order).labels)
         name = self.obs.name if self.obs is not None else None
         # Select the samples from samples that correspond to ``shot_range`` if provided
         if shot_range is not None:
@@ -216,25 +236,39 @@ class SampleMP(SampleMeasurement):
             # Ellipsis (...) otherwise would take up broadcasting and shots axes.
             samples = samples[..., slice(*shot_range), :]
 
-        if mapped_wires:
-            # if wires are provided, then we only return samples from those wires
-            samples = samples[..., mapped_wires]
+        if mapped_wires and mapped_wires != tuple(range(samples.shape[-1])):
+            # if wires are provided, then we only return samples from those wires;
+            # selecting all sampled wires in their original order requires no copy
+            samples = samples[..., list(mapped_wires)]
 
         num_wires = samples.shape[-1]  # wires is the last dimension
 
         if self.obs is None:
             # if no observable was provided then return the raw samples
-            return samples if bin_size is None else samples.T.reshape(num_wires, bin_size, -1)
+            if bin_size is None:
+                return samples
+            if qml.math.ndim(samples) == 2:
+                # Same layout as ``samples.T.reshape(num_wires, bin_size, -1)``, but splitting
+                # off the bins before moving the wire axis to the front avoids a strided copy
+                samples = qml.math.reshape(samples, (bin_size, -1, num_wires))
+                return qml.math.transpose(samples, (2, 0, 1))
+            return samples.T.reshape(num_wires, bin_size, -1)
 
         if str(name) in {"PauliX", "PauliY", "PauliZ", "Hadamard"}:
             # Process samples for observables with eigenvalues {1, -1}
-            samples = 1 - 2 * qml.math.squeeze(samples)
+            samples = qml.math.squeeze(samples)
+            # pylint: disable=unidiomatic-typecheck
+            if type(samples) is np.ndarray and samples.dtype.kind == "i":
+                # gathering from the eigenvalue table takes a single pass over the samples
+                samples = np.take(np.array([1, -1], dtype=samples.dtype), samples)
+            else:
+                samples = 1 - 2 * samples
         else:
             # Replace the basis state in the computational basis with the correct eigenvalue.
             # Extract only the columns of the basis samples required based on ``wires``.
-            powers_of_two = 2 ** qml.math.arange(num_wires)[::-1]
-            indices = samples @ powers_of_two
-            indices = qml.math.array(indices)  # Add np.array here for Jax support.
+            indices = samples @ _powers_of_two(num_wires)
+            if not isinstance(indices, np.ndarray):
+                indices = qml.math.array(indices)  # Add np.array here for Jax support.
             try:
                 samples = self.obs.eigvals()[indices]
             except qml.operation.EigvalsUndefinedError as e:
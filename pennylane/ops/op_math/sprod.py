@@ -17,6 +17,9 @@ computing the scalar product of operations.
 """
 from typing import Union
 from copy import copy
+from numbers import Number, Real
+
+import numpy as np
 
 import pennylane as qml
 import pennylane.math as qnp
@@ -139,12 +142,25 @@ class SProd(ScalarSymbolicOp):
         super().__init__(base=base, scalar=scalar, do_queue=do_queue, id=id)
 
         if (base_pauli_rep := getattr(self.base, "_pauli_rep", None)) and (self.batch_size is None):
-            scalar = copy(self.scalar)
-            if qnp.get_interface(scalar) == "tensorflow" and not scalar.dtype.is_complex:
-                c = qnp.convert_like(1 + 0j, scalar)  # get a complex dtype in the same interface
-                scalar = qnp.cast_like(scalar, c)  # cast scalar to complex dtype
-
-            pr = {pw: qnp.dot(coeff, scalar) for pw, coeff in base_pauli_rep.items()}
+            if isinstance(self.scalar, Real) and self.scalar in (1, -1):
+                # plain (non-trainable) unit scalars only copy or negate the base coefficients
+                pr = (
+                    base_pauli_rep
+                    if self.scalar == 1
+                    else {pw: -coeff for pw, coeff in base_pauli_rep.items()}
+                )
+            elif qnp.get_interface(self.scalar, *base_pauli_rep.values()) == "numpy":
+                # scale all NumPy coefficients with a single vectorized product
+                coeffs = np.array(list(base_pauli_rep.values())) * self.scalar
+                pr = dict(zip(base_pauli_rep, coeffs))
+            else:
+                scalar = copy(self.scalar)
+                if qnp.get_interface(scalar) == "tensorflow" and not scalar.dtype.is_complex:
+                    # get a complex dtype in the same interface
+                    c = qnp.convert_like(1 + 0j, scalar)
+                    scalar = qnp.cast_like(scalar, c)  # cast scalar to complex dtype
+
+                pr = {pw: qnp.dot(coeff, scalar) for pw, coeff in base_pauli_rep.items()}
             self._pauli_rep = qml.pauli.PauliSentence(pr)
         else:
             self._pauli_rep = None
@@ -190,7 +206,12 @@ class SProd(ScalarSymbolicOp):
     def is_hermitian(self):
         """If the base operator is hermitian and the scalar is real,
         then the scalar product operator is hermitian."""
-        return self.base.is_hermitian and not qml.math.iscomplex(self.scalar)
+        if not self.base.is_hermitian:
+            return False
+        if isinstance(self.scalar, Real):
+            # plain real numbers need no interface dispatch to determine their dtype
+            return True
+        return not qml.math.iscomplex(self.scalar)
 
     # pylint: disable=arguments-renamed,invalid-overridden-method
     @property
@@ -250,6 +271,9 @@ class SProd(ScalarSymbolicOp):
 
     @staticmethod
     def _matrix(scalar, mat):
+        if isinstance(scalar, Number):
+            # plain Python and NumPy scalars multiply any matrix type directly
+            return scalar * mat
         if qml.math.get_interface(scalar) == "tensorflow":
             # we must cast ``scalar`` to complex to avoid an error
             scalar = qml.math.cast_like(scalar, mat)
@@ -267,6 +291,9 @@ class SProd(ScalarSymbolicOp):
 
     def pow(self, z):
         """Returns the operator raised to a given power."""
+        if z == 1:
+            # no need to wrap the base into a ``Pow`` operator
+            return super().pow(z)
         return [SProd(scalar=self.scalar**z, base=Pow(base=self.base, z=z))]
 
     def adjoint(self):
@@ -293,19 +320,20 @@ class SProd(ScalarSymbolicOp):
             pr.simplify()
             return pr.operation(wire_order=self.wires)
 
-        if self.scalar == 1:
-            return self.base.simplify()
-        if isinstance(self.base, SProd):
-            scalar = self.scalar * self.base.scalar
-            if scalar == 1:
-                return self.base.base.simplify()
-            return SProd(scalar=scalar, base=self.base.base.simplify())
+        # collect the scalars of all nested scalar products, so that the innermost
+        # base is simplified exactly once
+        scalar, base = self.scalar, self.base
+        while isinstance(base, SProd):
+            scalar = scalar * base.scalar
+            base = base.base
 
-        new_base = self.base.simplify()
-        if isinstance(new_base, Sum):
-            return Sum(
-                *(SProd(scalar=self.scalar, base=summand).simplify() for summand in new_base)
-            )
+        new_base = base.simplify()
         if isinstance(new_base, SProd):
-            return SProd(scalar=self.scalar, base=new_base).simplify()
-        return SProd(scalar=self.scalar, base=new_base)
+            scalar = scalar * new_base.scalar
+            new_base = new_base.base
+
+        if scalar == 1:
+            return new_base
+        if isinstance(new_base, Sum):
+            return Sum(*(SProd(scalar=scalar, base=summand).simplify() for summand in new_base))
+        return SProd(scalar=scalar, base=new_base)
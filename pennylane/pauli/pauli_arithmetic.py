@@ -116,6 +116,7 @@ class PauliWord(dict):
             if op == I:
                 del mapping[wire]
         super().__init__(mapping)
+        self._hash = None
 
     def __reduce__(self):
         """Defines how to pickle and unpickle a PauliWord. Otherwise, un-pickling
@@ -141,8 +142,35 @@ class PauliWord(dict):
         """Restrict updating PW after instantiation."""
         raise TypeError("PauliWord object does not support assignment")
 
+    def __delitem__(self, key):
+        """Restrict deleting items after instantiation."""
+        raise TypeError("PauliWord object does not support deletion")
+
+    def __ior__(self, other):
+        """Restrict in-place union after instantiation."""
+        raise TypeError("PauliWord object does not support assignment")
+
+    def setdefault(self, key, default=None):
+        """Restrict setting default items after instantiation."""
+        raise TypeError("PauliWord object does not support assignment")
+
+    def pop(self, key, *args):
+        """Restrict removing items after instantiation."""
+        raise TypeError("PauliWord object does not support deletion")
+
+    def popitem(self):
+        """Restrict removing items after instantiation."""
+        raise TypeError("PauliWord object does not support deletion")
+
+    def clear(self):
+        """Restrict removing items after instantiation."""
+        raise TypeError("PauliWord object does not support deletion")
+
     def __hash__(self):
-        return hash(frozenset(self.items()))
+        # PauliWords are immutable, so the hash is only computed once
+        if self._hash is None:
+            self._hash = hash(frozenset(self.items()))
+        return self._hash
 
     def __mul__(self, other):
         """Multiply two Pauli words together using the matrix product if wires overlap
@@ -513,21 +513,18 @@ def string_to_pauli_word(pauli_string, wire_map=None):
         first_wire = list(wire_map)[0]
         return Identity(first_wire)
 
-    pauli_word = None
-
-    for wire_name, wire_idx in wire_map.items():
-        pauli_char = pauli_string[wire_idx]
-
-        # Don't care about the identity
-        if pauli_char == "I":
-            continue
+    # Collect the factors first and build a single product, rather than chaining
+    # ``@`` which re-validates the wires of the growing product each time
+    factors = [
+        character_map[pauli_string[wire_idx]](wire_name)
+        for wire_name, wire_idx in wire_map.items()
+        if pauli_string[wire_idx] != "I"
+    ]
 
-        if pauli_word is not None:
-            pauli_word = pauli_word @ character_map[pauli_char](wire_name)
-        else:
-            pauli_word = character_map[pauli_char](wire_name)
+    if len(factors) == 1:
+        return factors[0]
 
-    return pauli_word
+    return qml.prod(*factors) if qml.operation.active_new_opmath() else Tensor(*factors)
 
 
 def pauli_word_to_matrix(pauli_word, wire_map=None):
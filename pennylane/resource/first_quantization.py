@@ -16,12 +16,55 @@ This module contains the functions needed for estimating the number of logical q
 non-Clifford gates for quantum algorithms in first quantization using a plane-wave basis.
 """
 # pylint: disable=no-self-use disable=too-many-arguments disable=too-many-instance-attributes
+import functools
+import math
+from collections.abc import Hashable
+
 import numpy
-from scipy import integrate
-from pennylane import numpy as np
+from scipy import special
 from pennylane.operation import AnyWires, Operation
 
 
+def _inverse_tangent_integral(x):
+    r"""Return the inverse tangent integral :math:`\int_0^x \arctan(t) / t \, dt`.
+
+    It is evaluated as the imaginary part of the dilogarithm :math:`\operatorname{Li}_2(ix)`,
+    using :func:`scipy.special.spence` which computes :math:`\operatorname{Li}_2(1 - z)`.
+    """
+    return special.spence(1 - 1j * x).imag
+
+
+# Catalan's constant, equal to Ti2(1)
+_CATALAN = 0.915965594177219015054603514932384110774
+
+
+def _memoize(f):
+    """Cache the results of the cost function ``f`` for repeated hashable inputs.
+
+    Keyword arguments are sorted before the lookup so that their order does not matter, while
+    positional and keyword calls are cached separately; the cost methods therefore call each
+    other with positional arguments only. Arguments are cached by type so that, e.g., an invalid
+    float number of electrons is not served the result computed for the equal integer. Calls with
+    unhashable arguments, such as arrays, are evaluated without the cache.
+    """
+    cached_f = functools.lru_cache(maxsize=4096, typed=True)(f)
+
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        if kwargs:
+            kwargs = dict(sorted(kwargs.items()))
+            if not all(isinstance(arg, Hashable) for arg in kwargs.values()):
+                return f(*args, **kwargs)
+        for arg in args:
+            if not isinstance(arg, Hashable):
+                return f(*args, **kwargs)
+        return cached_f(*args, **kwargs)
+
+    wrapper.cache_info = cached_f.cache_info
+    wrapper.cache_clear = cached_f.cache_clear
+    return wrapper
+
+
 class FirstQuantization(Operation):
     r"""Estimate the number of non-Clifford gates and logical qubits for a quantum phase estimation
     algorithm in first quantization using a plane-wave basis.
@@ -105,6 +148,7 @@ class FirstQuantization(Operation):
         super().__init__(wires=range(self.qubits))
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024, typed=True)
     def success_prob(n, br):
         r"""Return the probability of success for state preparation.
 
@@ -131,16 +175,17 @@ class FirstQuantization(Operation):
         if br <= 0 or not isinstance(br, int):
             raise ValueError("br must be a positive integer.")
 
-        c = n / 2 ** np.ceil(np.log2(n))
-        d = 2 * np.pi / 2**br
+        c = n / 2 ** math.ceil(math.log2(n))
+        d = 2 * math.pi / 2**br
 
-        theta = d * np.round((1 / d) * np.arcsin(np.sqrt(1 / (4 * c))))
+        theta = d * round((1 / d) * math.asin(math.sqrt(1 / (4 * c))))
 
-        p = c * ((1 + (2 - 4 * c) * np.sin(theta) ** 2) ** 2 + np.sin(2 * theta) ** 2)
+        p = c * ((1 + (2 - 4 * c) * math.sin(theta) ** 2) ** 2 + math.sin(2 * theta) ** 2)
 
         return p
 
     @staticmethod
+    @_memoize
     def norm(n, eta, omega, error, br=7, charge=0):
         r"""Return the 1-norm of a first-quantized Hamiltonian in the plane-wave basis.
 
@@ -255,40 +300,39 @@ class FirstQuantization(Operation):
         # target error in the qubitization of U+V which we set to be 0.01 of the algorithm error
         error_uv = 0.01 * error
 
+        n0 = n ** (1 / 3)
+        omega_third = omega ** (1 / 3)
+
         # taken from Eq. (22) of PRX Quantum 2, 040332 (2021)
-        n_p = int(np.ceil(np.log2(n ** (1 / 3) + 1)))
+        n_p = math.ceil(math.log2(n0 + 1))
+        # bracketed sum over the momentum register appearing in Eqs. (113, 132)
+        sum_np = 7 * 2 ** (n_p + 1) - 9 * n_p - 11 - 3 * 2 ** (-1 * n_p)
 
-        n0 = n ** (1 / 3)
+        # the double integral of 1 / (x^2 + y^2) over [1, n0]^2 has the closed form
+        # 2 Ti2(n0) - (pi / 2) ln(n0) - 2 Ti2(1), with Ti2 the inverse tangent integral
+        integral = 2 * _inverse_tangent_integral(n0) - math.pi / 2 * math.log(n0) - 2 * _CATALAN
         lambda_nu = (  # expression is taken from Eq. (F6) of PRX 8, 011044 (2018)
-            4 * np.pi * (np.sqrt(3) * n ** (1 / 3) / 2 - 1)
-            + 3
-            - 3 / n ** (1 / 3)
-            + 3 * integrate.nquad(lambda x, y: 1 / (x**2 + y**2), [[1, n0], [1, n0]])[0]
+            4 * math.pi * (math.sqrt(3) * n0 / 2 - 1) + 3 - 3 / n0 + 3 * integral
         )
         n_m = int(
-            np.log2(  # taken from Eq. (132) of PRX Quantum 2, 040332 (2021)
-                (2 * eta)
-                / (error_uv * np.pi * omega ** (1 / 3))
-                * (eta - 1 + 2 * l_z)
-                * (7 * 2 ** (n_p + 1) - 9 * n_p - 11 - 3 * 2 ** (-1 * n_p))
+            math.log2(  # taken from Eq. (132) of PRX Quantum 2, 040332 (2021)
+                (2 * eta) / (error_uv * math.pi * omega_third) * (eta - 1 + 2 * l_z) * sum_np
             )
         )
         # computed using Eq. (113) of PRX Quantum 2, 040332 (2021)
-        lambda_nu_1 = lambda_nu + 4 / 2**n_m * (
-            7 * 2 ** (n_p + 1) - 9 * n_p - 11 - 3 * 2 ** (-1 * n_p)
-        )
+        lambda_nu_1 = lambda_nu + 4 / 2**n_m * sum_np
 
         p_nu = 0.2398  # approximation from Eq. (29) in arxiv:1807.09802
         p_nu_amp = (
-            np.sin(3 * np.arcsin(np.sqrt(p_nu))) ** 2
+            math.sin(3 * math.asin(math.sqrt(p_nu))) ** 2
         )  # Eq. (129), PRX Quantum 2, 040332 (2021)
 
         # lambda_u and lambda_v are taken from Eq. (25) of PRX Quantum 2, 040332 (2021)
-        lambda_u = eta * l_z * lambda_nu / (np.pi * omega ** (1 / 3))
-        lambda_v = eta * (eta - 1) * lambda_nu / (2 * np.pi * omega ** (1 / 3))
+        lambda_u = eta * l_z * lambda_nu / (math.pi * omega_third)
+        lambda_v = eta * (eta - 1) * lambda_nu / (2 * math.pi * omega_third)
 
         # taken from Eq. (71) of PRX Quantum 2, 040332 (2021)
-        lambda_t_p = 6 * eta * np.pi**2 / omega ** (2 / 3) * 2 ** (2 * n_p - 2)
+        lambda_t_p = 6 * eta * math.pi**2 / omega ** (2 / 3) * 2 ** (2 * n_p - 2)
 
         # lambda_u_1 and lambda_v_1 are taken from Eq. (124) of PRX Quantum 2, 040332 (2021)
         lambda_u_1 = lambda_u * lambda_nu_1 / lambda_nu
@@ -305,7 +349,7 @@ class FirstQuantization(Operation):
         lambda_a = lambda_t_p + lambda_u_1 + lambda_v_1
         lambda_b = (lambda_u_1 + lambda_v_1 / (1 - 1 / eta)) / p_nu_amp
 
-        return np.maximum(lambda_a, lambda_b) / p_eq
+        return max(lambda_a, lambda_b) / p_eq
 
     @staticmethod
     def _cost_qrom(lz):
@@ -326,11 +370,15 @@ class FirstQuantization(Operation):
         if lz <= 0 or not isinstance(lz, (int, numpy.integer)):
             raise ValueError("The sum of the atomic numbers must be a positive integer.")
 
-        k_f = np.floor(np.log2(lz) / 2)
-        k_c = np.ceil(np.log2(lz) / 2)
+        lz = int(lz)
+
+        # floor(log2(lz) / 2) and ceil(log2(lz) / 2) computed exactly from the bit lengths
+        k_f = (lz.bit_length() - 1) // 2
+        k_c = ((lz - 1).bit_length() + 1) // 2
 
-        cost_f = int(2**k_f + np.ceil(2 ** (-1 * k_f) * lz))
-        cost_c = int(2**k_c + np.ceil(2 ** (-1 * k_c) * lz))
+        # -(-lz >> k) is the integer ceiling of lz / 2**k
+        cost_f = 2**k_f - (-lz >> k_f)
+        cost_c = 2**k_c - (-lz >> k_c)
 
         return min(cost_f, cost_c)
 
@@ -380,17 +428,17 @@ class FirstQuantization(Operation):
         if not isinstance(charge, int):
             raise ValueError("system charge must be an integer.")
 
-        lamb = FirstQuantization.norm(n, eta, omega, error, br=7, charge=charge)
+        lamb = FirstQuantization.norm(n, eta, omega, error, 7, charge)
         alpha = 0.01
         l_z = eta + charge
-        l_nu = 2 * np.pi * n ** (2 / 3)
+        l_nu = 2 * math.pi * n ** (2 / 3)
 
         # n_eta and n_etaz are defined in the third and second paragraphs of page 040332-15
-        n_eta = np.ceil(np.log2(eta))
-        n_etaz = np.ceil(np.log2(eta + 2 * l_z))
+        n_eta = math.ceil(math.log2(eta))
+        n_etaz = math.ceil(math.log2(eta + 2 * l_z))
 
         # n_p is taken from Eq. (22)
-        n_p = int(np.ceil(np.log2(n ** (1 / 3) + 1)))
+        n_p = math.ceil(math.log2(n ** (1 / 3) + 1))
 
         # errors in Eqs. (132-134) are set to be 0.01 of the algorithm error
         error_t = alpha * error
@@ -398,12 +446,12 @@ class FirstQuantization(Operation):
         error_m = alpha * error
 
         # parameters taken from Eqs. (132-134) of PRX Quantum 2, 040332 (2021)
-        n_t = int(np.log2(np.pi * lamb / error_t))  # Eq. (134)
-        n_r = int(np.log2((eta * l_z * l_nu) / (error_r * omega ** (1 / 3))))  # Eq. (133)
+        n_t = int(math.log2(math.pi * lamb / error_t))  # Eq. (134)
+        n_r = int(math.log2((eta * l_z * l_nu) / (error_r * omega ** (1 / 3))))  # Eq. (133)
         n_m = int(
-            np.log2(  # Eq. (132)
+            math.log2(  # Eq. (132)
                 (2 * eta)
-                / (error_m * np.pi * omega ** (1 / 3))
+                / (error_m * math.pi * omega ** (1 / 3))
                 * (eta - 1 + 2 * l_z)
                 * (7 * 2 ** (n_p + 1) - 9 * n_p - 11 - 3 * 2 ** (-1 * n_p))
             )
@@ -418,7 +466,7 @@ class FirstQuantization(Operation):
         cost += 5 * (n_p - 1) + 2 + 24 * n_p + 6 * n_p * n_r + 18
         cost += n_etaz + 2 * n_eta + 6 * n_p + n_m + 16
 
-        return int(np.ceil(cost))
+        return math.ceil(cost)
 
     @staticmethod
     def estimation_cost(n, eta, omega, error, br=7, charge=0):
@@ -451,14 +499,15 @@ class FirstQuantization(Operation):
         if error <= 0.0:
             raise ValueError("The target error must be greater than zero.")
 
-        lamb = FirstQuantization.norm(n, eta, omega, error, br=br, charge=charge)
+        lamb = FirstQuantization.norm(n, eta, omega, error, br, charge)
         alpha = 0.01
         # qpe_error obtained to satisfy inequality (131)
-        error_qpe = np.sqrt(error**2 * (1 - (3 * alpha) ** 2))
+        error_qpe = math.sqrt(error**2 * (1 - (3 * alpha) ** 2))
 
-        return int(np.ceil(np.pi * lamb / (2 * error_qpe)))
+        return math.ceil(math.pi * lamb / (2 * error_qpe))
 
     @staticmethod
+    @_memoize
     def gate_cost(n, eta, omega, error, br=7, charge=0):
         r"""Return the total number of Toffoli gates needed to implement the first quantization
         algorithm.
@@ -504,12 +553,13 @@ class FirstQuantization(Operation):
         if br <= 0 or not isinstance(br, int):
             raise ValueError("br must be a positive integer.")
 
-        e_cost = FirstQuantization.estimation_cost(n, eta, omega, error, br=br, charge=charge)
+        e_cost = FirstQuantization.estimation_cost(n, eta, omega, error, br, charge)
         u_cost = FirstQuantization.unitary_cost(n, eta, omega, error, br, charge)
 
         return e_cost * u_cost
 
     @staticmethod
+    @_memoize
     def qubit_cost(n, eta, omega, error, br=7, charge=0):
         r"""Return the number of logical qubits needed to implement the first quantization
         algorithm.
@@ -552,13 +602,13 @@ class FirstQuantization(Operation):
         if not isinstance(charge, int):
             raise ValueError("system charge must be an integer.")
 
-        lamb = FirstQuantization.norm(n, eta, omega, error, br=br, charge=charge)
+        lamb = FirstQuantization.norm(n, eta, omega, error, br, charge)
         alpha = 0.01
         l_z = eta + charge
-        l_nu = 2 * np.pi * n ** (2 / 3)
+        l_nu = 2 * math.pi * n ** (2 / 3)
 
         # n_p is taken from Eq. (22) of PRX Quantum 2, 040332 (2021)
-        n_p = np.ceil(np.log2(n ** (1 / 3) + 1))
+        n_p = math.ceil(math.log2(n ** (1 / 3) + 1))
 
         # errors in Eqs. (132-134) of PRX Quantum 2, 040332 (2021),
         # set to 0.01 of the algorithm error
@@ -567,12 +617,12 @@ class FirstQuantization(Operation):
         error_m = alpha * error
 
         # parameters taken from Eqs. (132-134) of PRX Quantum 2, 040332 (2021)
-        n_t = int(np.log2(np.pi * lamb / error_t))  # Eq. (134)
-        n_r = int(np.log2((eta * l_z * l_nu) / (error_r * omega ** (1 / 3))))  # Eq. (133)
+        n_t = int(math.log2(math.pi * lamb / error_t))  # Eq. (134)
+        n_r = int(math.log2((eta * l_z * l_nu) / (error_r * omega ** (1 / 3))))  # Eq. (133)
         n_m = int(
-            np.log2(  # Eq. (132)
+            math.log2(  # Eq. (132)
                 (2 * eta)
-                / (error_m * np.pi * omega ** (1 / 3))
+                / (error_m * math.pi * omega ** (1 / 3))
                 * (eta - 1 + 2 * l_z)
                 * (7 * 2 ** (n_p + 1) - 9 * n_p - 11 - 3 * 2 ** (-1 * n_p))
             )
@@ -580,12 +630,12 @@ class FirstQuantization(Operation):
 
         alpha = 0.01
         # qpe_error obtained to satisfy inequality (131) of PRX Quantum 2, 040332 (2021)
-        error_qpe = np.sqrt(error**2 * (1 - (3 * alpha) ** 2))
+        error_qpe = math.sqrt(error**2 * (1 - (3 * alpha) ** 2))
 
         # the expression for computing the cost is taken from Eq. (101) of arXiv:2204.11890v1
         qubits = 3 * eta * n_p + 4 * n_m * n_p + 12 * n_p
-        qubits += 2 * (np.ceil(np.log2(np.ceil(np.pi * lamb / (2 * error_qpe))))) + 5 * n_m
-        qubits += 2 * np.ceil(np.log2(eta)) + 3 * n_p**2 + np.ceil(np.log2(eta + 2 * l_z))
-        qubits += np.maximum(5 * n_p + 1, 5 * n_r - 4) + np.maximum(n_t, n_r + 1) + 33
+        qubits += 2 * math.ceil(math.log2(math.ceil(math.pi * lamb / (2 * error_qpe)))) + 5 * n_m
+        qubits += 2 * math.ceil(math.log2(eta)) + 3 * n_p**2 + math.ceil(math.log2(eta + 2 * l_z))
+        qubits += max(5 * n_p + 1, 5 * n_r - 4) + max(n_t, n_r + 1) + 33
 
-        return int(np.ceil(qubits))
+        return math.ceil(qubits)
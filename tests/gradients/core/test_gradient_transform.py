@@ -18,6 +18,7 @@ import pennylane as qml
 from pennylane import numpy as np
 from pennylane.gradients.gradient_transform import (
     _gradient_analysis,
+    _ops_influencing_observables,
     choose_grad_methods,
     _grad_method_validation,
 )
@@ -86,6 +87,53 @@ class TestGradAnalysis:
         assert tape._par_info[0]["grad_method"] == "A"
         assert tape._par_info[1]["grad_method"] == "0"
 
+    def test_influence_caching(self):
+        """Test that the influence analysis is reused for structurally
+        identical tapes with different parameters, without constructing
+        the circuit graph."""
+
+        def make_tape(x, y):
+            with qml.queuing.AnnotatedQueue() as q:
+                qml.RX(x, wires=["cache_a"])
+                qml.RY(y, wires=["cache_b"])
+                qml.CNOT(wires=["cache_a", "cache_c"])
+                qml.expval(qml.PauliZ("cache_c"))
+            return qml.tape.QuantumScript.from_queue(q)
+
+        tape = make_tape(0.543, -0.654)
+        _gradient_analysis(tape)
+        hits = _ops_influencing_observables.cache_info().hits
+
+        assert tape._graph is None
+        assert tape._par_info[0]["grad_method"] == "A"
+        assert tape._par_info[1]["grad_method"] == "0"
+
+        new_tape = make_tape(0.1, 0.2)
+        _gradient_analysis(new_tape)
+        assert _ops_influencing_observables.cache_info().hits == hits + 1
+
+        assert new_tape._graph is None
+        assert new_tape._par_info[0]["grad_method"] == "A"
+        assert new_tape._par_info[1]["grad_method"] == "0"
+
+    @pytest.mark.parametrize(
+        "measurement, expected", [(qml.probs(wires=[0]), "0"), (qml.probs(), "A")]
+    )
+    def test_independent_measurement_without_wires(self, measurement, expected):
+        """Test that a measurement without wires is treated as acting on all wires."""
+
+        with qml.queuing.AnnotatedQueue() as q:
+            qml.RX(0.543, wires=[0])
+            qml.RY(-0.654, wires=[1])
+            qml.CNOT(wires=[1, 2])
+            qml.apply(measurement)
+
+        tape = qml.tape.QuantumScript.from_queue(q)
+        _gradient_analysis(tape)
+
+        assert tape._par_info[0]["grad_method"] == "A"
+        assert tape._par_info[1]["grad_method"] == expected
+
     def test_independent_no_graph_mode(self):
         """In non-graph mode, it is impossible to determine
         if a parameter is independent or not"""
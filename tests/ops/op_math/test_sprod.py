@@ -698,6 +698,18 @@ class TestProperties:
         """Test the pauli rep is produced as expected."""
         assert op._pauli_rep == rep  # pylint: disable=protected-access
 
+    @pytest.mark.parametrize("scalar", [1, -1, 1.0, -1.0])
+    def test_pauli_rep_unit_scalar(self, scalar):
+        """Test that the pauli rep for a unit scalar is a new sentence with the
+        coefficients of the base copied or negated."""
+        # pylint: disable=protected-access
+        base = qml.s_prod(0.5, qml.prod(qml.PauliX(0), qml.PauliY(1)))
+        op = qml.s_prod(scalar, base)
+        expected = qml.pauli.PauliSentence({qml.pauli.PauliWord({0: "X", 1: "Y"}): 0.5 * scalar})
+
+        assert op._pauli_rep == expected
+        assert op._pauli_rep is not base._pauli_rep
+
     def test_pauli_rep_none_if_base_pauli_rep_none(self):
         """Test that None is produced if the base op does not have a pauli rep"""
         base = qml.RX(1.23, wires=0)
@@ -785,6 +797,29 @@ class TestSimplify:
         assert simplified_op.data == final_op.data
         assert simplified_op.arithmetic_depth == final_op.arithmetic_depth
 
+    def test_simplify_deeply_nested_sprod(self):
+        """Test that all levels of nested SProd operators are combined into one."""
+        sprod_op = s_prod(2, s_prod(3, s_prod(4, qml.RX(1.23, wires=0))))
+        final_op = s_prod(24, qml.RX(1.23, wires=0))
+        simplified_op = sprod_op.simplify()
+
+        assert isinstance(simplified_op, qml.ops.SProd)
+        assert repr(simplified_op) == repr(final_op)
+        assert simplified_op.data == final_op.data
+        assert simplified_op.arithmetic_depth == final_op.arithmetic_depth
+
+    def test_simplify_nested_sprod_over_sum(self):
+        """Test that nested scalar products of a Sum are combined and distributed over the
+        summands, as for a single scalar product of a Sum."""
+        sprod_op = s_prod(2, s_prod(3, qml.sum(qml.RX(1, wires=0), qml.RY(2, wires=1))))
+        final_op = qml.sum(s_prod(6, qml.RX(1.0, wires=0)), s_prod(6, qml.RY(2.0, wires=1)))
+        simplified_op = sprod_op.simplify()
+
+        assert isinstance(simplified_op, qml.ops.Sum)
+        assert repr(simplified_op) == repr(final_op)
+        assert simplified_op.data == final_op.data
+        assert simplified_op.arithmetic_depth == final_op.arithmetic_depth
+
     def test_simplify_with_sum_operator(self):
         """Test the simplify method a scalar product of a Sum operator."""
         sprod_op = s_prod(0 - 3j, qml.sum(qml.PauliX(0), qml.PauliX(0)))
@@ -1084,6 +1119,15 @@ class TestArithmetic:
         assert pow_op.data == final_op.data
         assert pow_op.arithmetic_depth == final_op.arithmetic_depth
 
+    def test_pow_one(self):
+        """Test that raising an SProd to the power of one returns a copy without a Pow base."""
+        sprod_op = SProd(3, qml.RX(1.23, wires=0))
+        pow_op = sprod_op.pow(z=1)
+
+        assert len(pow_op) == 1
+        assert pow_op[0] is not sprod_op
+        assert qml.equal(pow_op[0], sprod_op)
+
     def test_adjoint(self):
         """Test the adjoint method for Sprod Operators."""
 
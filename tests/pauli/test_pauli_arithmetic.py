@@ -71,6 +71,38 @@ class TestPauliWord:
         with pytest.raises(TypeError, match="PauliWord object does not support assignment"):
             pw.update({3: Z})  # trying to add to a pw after instantiation is prohibited
 
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda pw: pw.setdefault(3, Z),
+            lambda pw: pw.__ior__({3: Z}),
+        ],
+    )
+    def test_assignment_methods(self, mutate):
+        """Test that the remaining dict methods adding items raise an error"""
+        pw = PauliWord({0: X, 1: Y})
+        with pytest.raises(TypeError, match="PauliWord object does not support assignment"):
+            mutate(pw)
+        assert pw == PauliWord({0: X, 1: Y})
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda pw: pw.pop(1),
+            lambda pw: pw.popitem(),
+            lambda pw: pw.__delitem__(1),
+            lambda pw: pw.clear(),
+        ],
+    )
+    def test_deletion_methods(self, mutate):
+        """Test that removing items raises an error, so that the cached hash stays valid"""
+        pw = PauliWord({0: X, 1: Y})
+        h = hash(pw)
+        with pytest.raises(TypeError, match="PauliWord object does not support deletion"):
+            mutate(pw)
+        assert pw == PauliWord({0: X, 1: Y})
+        assert hash(pw) == h == hash(PauliWord({0: X, 1: Y}))
+
     def test_hash(self):
         """Test that a unique hash exists for different PauliWords."""
         pw_1 = PauliWord({0: I, 1: X, 2: Y})
@@ -231,6 +263,17 @@ class TestPauliWord:
         new_pw = pickle.loads(serialization)
         assert pw == new_pw
 
+    def test_hash_after_pickling_and_copying(self):
+        """Test that the cached hash of a PauliWord matches that of its unpickled and
+        copied versions, so that they can be used interchangeably as dictionary keys."""
+        pw = PauliWord({2: "X", 3: "Y", 4: "Z"})
+        h = hash(pw)
+
+        assert hash(pickle.loads(pickle.dumps(pw))) == h
+        assert hash(copy(pw)) == h
+        assert hash(deepcopy(pw)) == h
+        assert {pw: 1.0}[PauliWord({4: "Z", 3: "Y", 2: "X"})] == 1.0
+
     @pytest.mark.parametrize(
         "word,wire_map,expected",
         [
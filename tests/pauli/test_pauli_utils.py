@@ -417,6 +417,24 @@ class TestGroupingUtils:
         obtained_pauli = string_to_pauli_word(pauli_string, wire_map)
         assert obtained_pauli.compare(expected_pauli)
 
+    @pytest.mark.parametrize(
+        "pauli_string,wire_map,expected_pauli",
+        [
+            ("ZYIZ", {"a": 0, "b": 1, "c": 2, "d": 3}, [PauliZ("a"), PauliY("b"), PauliZ("d")]),
+            ("ZYZ", None, [PauliZ(0), PauliY(1), PauliZ(2)]),
+        ],
+    )
+    def test_string_to_pauli_word_new_opmath(self, pauli_string, wire_map, expected_pauli):
+        """Test that strings are converted into Prod Pauli words with new operator arithmetic."""
+        qml.operation.enable_new_opmath()
+        try:
+            obtained_pauli = string_to_pauli_word(pauli_string, wire_map)
+        finally:
+            qml.operation.disable_new_opmath()
+
+        assert isinstance(obtained_pauli, qml.ops.Prod)
+        assert qml.equal(obtained_pauli, qml.prod(*expected_pauli))
+
     @pytest.mark.parametrize(
         "non_pauli_string,wire_map,error_type,error_message",
         [
@@ -264,3 +264,41 @@ def test_norm_error(n, eta, omega, error, br, charge):
     r"""Test that norm raises an error with incorrect inputs."""
     with pytest.raises(ValueError, match="must be"):
         qml.resource.FirstQuantization.norm(n, eta, omega, error, br, charge)
+
+
+@pytest.mark.parametrize("n", [8, 1000, 10000, 100000, 10**9])
+def test_norm_integral(n):
+    r"""Test that the closed-form double integral used in norm matches numerical integration."""
+    # pylint: disable=import-outside-toplevel, protected-access
+    from scipy import integrate
+    from pennylane.resource import first_quantization as fq
+
+    n0 = n ** (1 / 3)
+    integral = 2 * fq._inverse_tangent_integral(n0) - np.pi / 2 * np.log(n0) - 2 * fq._CATALAN
+    integral_ref = integrate.nquad(lambda x, y: 1 / (x**2 + y**2), [[1, n0], [1, n0]])[0]
+
+    assert np.allclose(integral, integral_ref, atol=1e-12, rtol=0)
+
+
+def test_norm_cached_inputs():
+    r"""Test that cached norm values are not reused for inputs that only compare equal."""
+    norm = qml.resource.FirstQuantization.norm(10000, 156, 1145.166, 0.001)
+
+    assert np.allclose(qml.resource.FirstQuantization.norm(10000, 156, 1145.166, 0.001), norm)
+    assert np.allclose(
+        qml.resource.FirstQuantization.norm(np.array(10000), 156, 1145.166, 0.001), norm
+    )
+    with pytest.raises(ValueError, match="must be"):
+        qml.resource.FirstQuantization.norm(10000, 156.0, 1145.166, 0.001)
+
+
+def test_norm_cache_call_forms():
+    r"""Test that positional and keyword calls to norm with the same values share a cache entry."""
+    for method in ["norm", "gate_cost", "qubit_cost"]:
+        getattr(qml.resource.FirstQuantization, method).cache_clear()
+
+    qml.resource.FirstQuantization(10000, 156, 1145.166)
+    info = qml.resource.FirstQuantization.norm.cache_info()
+
+    assert info.misses == 1
+    assert info.hits >= 1